@@ -1,11 +1,314 @@
 import sys
+import os
+import csv
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.patches import Rectangle
 from matplotlib.widgets import Slider
 import argparse
 
-def plot_csv_data(csv_file, x_tick_spacing=10, y_tick_spacing=None):
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Maximum number of points drawn per line; larger windows are decimated
+MAX_PLOT_POINTS = 2000
+
+# Windows with more data points than this are drawn without markers
+MARKER_POINT_LIMIT = 1000
+
+# Files larger than this (in bytes) are streamed instead of loaded as a DataFrame
+STREAM_SIZE_THRESHOLD = 100 * 1024 * 1024
+
+# Rows per chunk when streaming with pandas (pyarrow uses its own block size)
+STREAM_CHUNK_ROWS = 100000
+
+# Files larger than this (in bytes) are stored as float32 unless overridden
+FLOAT32_SIZE_THRESHOLD = 100 * 1024 * 1024
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def minmax_bucket_indices(y, n_buckets, out):
+        """
+        Compiled kernel writing the min and max index of each bucket into out.
+        
+        out must hold 2 * n_buckets + 2 entries; the first and last entries
+        are the first and last indices of y. Buckets are processed in
+        parallel and each writes its own slots, so out ends up sorted.
+        """
+        n = len(y)
+        out[0] = 0
+        out[2 * n_buckets + 1] = n - 1
+        for b in prange(n_buckets):
+            start = b * n // n_buckets
+            stop = (b + 1) * n // n_buckets
+            # Seed from the first non-NaN sample so missing values are
+            # skipped; an all-NaN bucket keeps its first sample as a gap
+            first = start
+            while first < stop - 1 and np.isnan(y[first]):
+                first += 1
+            lo = first
+            hi = first
+            lo_val = y[first]
+            hi_val = y[first]
+            if np.isnan(lo_val):
+                lo = start
+                hi = start
+            for i in range(first + 1, stop):
+                val = y[i]
+                if val < lo_val:
+                    lo_val = val
+                    lo = i
+                elif val > hi_val:
+                    hi_val = val
+                    hi = i
+            out[2 * b + 1] = min(lo, hi)
+            out[2 * b + 2] = max(lo, hi)
+
+def warm_up_decimation(dtype):
+    """
+    Compile the Numba decimation kernel for dtype ahead of time.
+    
+    The first call of the kernel triggers JIT compilation, which would
+    otherwise freeze the UI inside the first large reset or zoom.
+    
+    Args:
+        dtype: dtype of the arrays that will be decimated
+    """
+    if njit is not None:
+        decimate_minmax(np.zeros(MAX_PLOT_POINTS + 1, dtype=dtype))
+
+def decimate_minmax(y, target=MAX_PLOT_POINTS):
+    """
+    Select a subset of indices that preserves the visual envelope of y.
+    
+    The data is split into target/2 evenly spaced buckets and the indices of
+    the minimum and maximum sample of each bucket are kept, along with the
+    first and last points. Uses a compiled Numba kernel when numba is
+    installed.
+    
+    Args:
+        y: 1-D NumPy array of values
+        target: Approximate maximum number of indices to return
+    
+    Returns:
+        Sorted NumPy array of indices into y
+    """
+    n = len(y)
+    if n <= target:
+        return np.arange(n)
+    
+    n_buckets = max(1, target // 2)
+    if njit is not None:
+        indices = np.empty(2 * n_buckets + 2, dtype=np.intp)
+        minmax_bucket_indices(y, n_buckets, indices)
+        return np.unique(indices)
+    
+    # Bucket boundaries match the Numba kernel, so no bucket is wider than
+    # ceil(n / n_buckets) and both paths draw the same points
+    edges = np.arange(n_buckets) * n // n_buckets
+    bucket_of = np.repeat(np.arange(n_buckets), np.diff(np.append(edges, n)))
+    
+    # Missing values are masked out of the reductions so a single NaN doesn't
+    # collapse its bucket; an all-NaN bucket keeps its first sample as a gap
+    nan_mask = np.isnan(y)
+    y_lo = np.where(nan_mask, np.inf, y)
+    y_hi = np.where(nan_mask, -np.inf, y)
+    
+    # The first sample equal to each bucket's extreme is its min/max position
+    indices = [[0, n - 1]]
+    for masked, reduce in ((y_lo, np.minimum), (y_hi, np.maximum)):
+        extremes = reduce.reduceat(masked, edges)
+        hits = np.flatnonzero(masked == extremes[bucket_of])
+        _, first = np.unique(bucket_of[hits], return_index=True)
+        indices.append(hits[first])
+    
+    return np.unique(np.concatenate(indices))
+
+def read_csv_file(csv_file, fast_io=False):
+    """
+    Read a CSV file into a DataFrame.
+    
+    Args:
+        csv_file: Path to the CSV file
+        fast_io: Use the multithreaded pyarrow CSV reader when available
+    
+    Returns:
+        pandas DataFrame with the file contents
+    """
+    if fast_io:
+        try:
+            return pd.read_csv(csv_file, engine='pyarrow')
+        except ImportError:
+            print("Warning: pyarrow is not installed, using the default CSV reader")
+    
+    return pd.read_csv(csv_file)
+
+def iter_csv_chunks(csv_file, column_names):
+    """
+    Yield the columns of successive chunks of a CSV file as float64 arrays.
+    
+    Uses the pyarrow streaming reader when available, otherwise pandas'
+    chunked reader.
+    
+    Args:
+        csv_file: Path to the CSV file
+        column_names: Column names from the header row
+    
+    Yields:
+        List of 1-D NumPy arrays, one per column
+    """
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        for chunk in pd.read_csv(csv_file, chunksize=STREAM_CHUNK_ROWS):
+            yield [chunk.iloc[:, j].to_numpy(dtype=np.float64) for j in range(chunk.shape[1])]
+        return
+    
+    # Fix the column types up front; otherwise they are inferred from the
+    # first block and a later block with different values fails to convert
+    convert_options = pa_csv.ConvertOptions(
+        column_types={name: pa.float64() for name in column_names}
+    )
+    reader = pa_csv.open_csv(csv_file, convert_options=convert_options)
+    for batch in reader:
+        yield [batch.column(j).to_numpy(zero_copy_only=False) for j in range(batch.num_columns)]
+
+def stream_csv_arrays(csv_file, y_dtype=np.float64):
+    """
+    Stream a CSV file directly into preallocated NumPy arrays.
+    
+    Avoids building a DataFrame, which roughly halves peak memory on large
+    files. The row count is estimated from a sample at the start of the file
+    and the arrays are grown if the estimate is too low.
+    
+    Args:
+        csv_file: Path to the CSV file
+        y_dtype: dtype of the Y matrix
+    
+    Returns:
+        Tuple of (column names, X array, column-major Y matrix)
+    """
+    with open(csv_file, newline='', encoding='utf-8-sig') as f:
+        column_names = next(csv.reader(f))
+    
+    with open(csv_file, 'rb') as f:
+        sample = f.read(1 << 16)
+    file_size = os.path.getsize(csv_file)
+    capacity = max(1, int(file_size * sample.count(b'\n') / max(1, len(sample))))
+    
+    n_y = len(column_names) - 1
+    x_arr = np.empty(capacity)
+    y_mat = np.empty((capacity, n_y), dtype=y_dtype, order='F')
+    n_rows = 0
+    
+    for columns in iter_csv_chunks(csv_file, column_names):
+        n_new = len(columns[0])
+        if n_rows + n_new > capacity:
+            capacity = max(n_rows + n_new, int(capacity * 1.5))
+            grown_x = np.empty(capacity)
+            grown_x[:n_rows] = x_arr[:n_rows]
+            grown_y = np.empty((capacity, n_y), dtype=y_dtype, order='F')
+            grown_y[:n_rows] = y_mat[:n_rows]
+            x_arr, y_mat = grown_x, grown_y
+        
+        x_arr[n_rows:n_rows + n_new] = columns[0]
+        for j in range(n_y):
+            y_mat[n_rows:n_rows + n_new, j] = columns[j + 1]
+        n_rows += n_new
+    
+    # Trim the unused capacity so the arrays stay contiguous
+    if n_rows < capacity:
+        x_arr = x_arr[:n_rows].copy()
+        y_mat = y_mat[:n_rows].copy(order='F')
+    
+    return column_names, x_arr, y_mat
+
+def load_csv_arrays(csv_file, fast_io=False, y_dtype=np.float64):
+    """
+    Load a CSV file as the arrays used for plotting.
+    
+    Args:
+        csv_file: Path to the CSV file
+        fast_io: Use the pyarrow CSV engine for files that are read in one go
+        y_dtype: dtype of the Y matrix
+    
+    Returns:
+        Tuple of (column names, X array, column-major Y matrix)
+    """
+    if os.path.getsize(csv_file) > STREAM_SIZE_THRESHOLD:
+        return stream_csv_arrays(csv_file, y_dtype)
+    
+    df = read_csv_file(csv_file, fast_io)
+    column_names = list(df.columns)
+    x_arr = df.iloc[:, 0].to_numpy()
+    y_mat = np.asfortranarray(df.iloc[:, 1:].to_numpy(dtype=y_dtype))
+    return column_names, x_arr, y_mat
+
+def narrow_x_values(x_arr):
+    """
+    Convert X values to float32 if that keeps their order intact.
+    
+    X values often need more precision than Y values (e.g. epoch timestamps),
+    so the conversion is only done when neighbouring points that were
+    distinct and ordered stay that way in float32.
+    
+    Args:
+        x_arr: 1-D NumPy array of X values
+    
+    Returns:
+        float32 copy of x_arr, or x_arr itself if float32 would lose precision
+    """
+    x_narrow = x_arr.astype(np.float32)
+    if np.array_equal(np.sign(np.diff(x_arr)), np.sign(np.diff(x_narrow))):
+        return x_narrow
+    return x_arr
+
+def setup_ticks(ax, x_arr, y_min, y_range, x_tick_spacing, y_tick_spacing=None):
+    """
+    Place fixed X-axis ticks every x_tick_spacing data points and, optionally,
+    evenly spaced Y-axis ticks.
+    
+    Args:
+        ax: Axes to configure
+        x_arr: NumPy array of X values
+        y_min: Smallest Y value across all columns
+        y_range: Difference between the largest and smallest Y value
+        x_tick_spacing: Number of data points between X-axis tick marks
+        y_tick_spacing: Number of data points between Y-axis tick marks (optional)
+    """
+    # Setup X-axis ticks based on data point spacing
+    # Generate tick positions for ALL data points at the specified interval
+    n_points = len(x_arr)
+    tick_indices = np.arange(0, n_points, x_tick_spacing)
+    if tick_indices[-1] != n_points - 1:
+        tick_indices = np.append(tick_indices, n_points - 1)  # Always include last point
+    
+    # Gather positions and format labels in bulk
+    all_tick_positions = x_arr[tick_indices]
+    all_tick_labels = np.char.mod('%.4g', all_tick_positions).tolist()
+    
+    ax.set_xticks(all_tick_positions)
+    ax.set_xticklabels(all_tick_labels, rotation=45, ha='right')
+    
+    # Setup Y-axis ticks
+    if y_tick_spacing:
+        # Calculate how many ticks we want based on spacing
+        n_y_ticks = max(2, int(n_points / y_tick_spacing) + 1)
+        y_tick_step = y_range / (n_y_ticks - 1)
+        y_tick_positions = y_min + np.arange(n_y_ticks) * y_tick_step
+        ax.set_yticks(y_tick_positions)
+        ax.set_yticklabels(np.char.mod('%.4g', y_tick_positions).tolist())
+
+def plot_csv_data(csv_file, x_tick_spacing=10, y_tick_spacing=None, fast_io=False, float32=None):
     """
     Read CSV file and create an interactive plot with fixed tick spacing.
     
@@ -13,42 +316,62 @@ def plot_csv_data(csv_file, x_tick_spacing=10, y_tick_spacing=None):
         csv_file: Path to the CSV file
         x_tick_spacing: Number of data points between X-axis tick marks
         y_tick_spacing: Number of data points between Y-axis tick marks (for Y-range calculation)
+        fast_io: Read the file with the pyarrow CSV engine
+        float32: Store the data as float32; None decides based on file size
     """
     try:
-        # Read the CSV file
-        df = pd.read_csv(csv_file)
+        # float32 is plenty for plotting and halves memory traffic
+        if float32 is None:
+            float32 = os.path.getsize(csv_file) > FLOAT32_SIZE_THRESHOLD
+        
+        # Read the CSV file. X values (first column) come back as a NumPy
+        # array for fast indexing, and all Y columns (column 2 onwards) are
+        # packed into one column-major array so each column is contiguous
+        # and reductions run in one pass
+        column_names, x_arr, y_mat = load_csv_arrays(
+            csv_file, fast_io, np.float32 if float32 else np.float64
+        )
+        if float32:
+            x_arr = narrow_x_values(x_arr)
         
         # Validate that we have at least 2 columns
-        if len(df.columns) < 2:
+        if len(column_names) < 2:
             print("Error: CSV file must have at least 2 columns")
             sys.exit(1)
         
-        # Extract X values (first column)
-        x_data = df.iloc[:, 0]
-        x_label = df.columns[0]
-        
-        # Get all Y columns (column 2 onwards)
-        y_columns = df.columns[1:]
+        x_label = column_names[0]
+        y_col_names = column_names[1:]
         
         # Number of data points
-        n_points = len(x_data)
+        n_points = len(x_arr)
+        
+        # Only windows wider than MAX_PLOT_POINTS are ever decimated
+        if n_points > MAX_PLOT_POINTS:
+            warm_up_decimation(y_mat.dtype)
         
         # Create the figure and axis
         fig, ax = plt.subplots(figsize=(12, 6))
         plt.subplots_adjust(bottom=0.2, right=0.85)
         
         # Store original data limits
-        x_min, x_max = x_data.min(), x_data.max()
+        x_min, x_max = np.nanmin(x_arr), np.nanmax(x_arr)
+        
+        # Sorted X values allow binary search for nearest-point lookups
+        x_sorted = bool(np.all(np.diff(x_arr) >= 0))
         
-        # Find global Y limits across all Y columns
-        y_min = df.iloc[:, 1:].min().min()
-        y_max = df.iloc[:, 1:].max().max()
+        # Find global Y limits across all Y columns. Plain min/max are the
+        # tightest reductions but return NaN if any value is missing, in
+        # which case fall back to the NaN-skipping versions
+        y_min, y_max = float(y_mat.min()), float(y_mat.max())
+        if np.isnan(y_min) or np.isnan(y_max):
+            y_min, y_max = float(np.nanmin(y_mat)), float(np.nanmax(y_mat))
         y_range = y_max - y_min
         
-        # Plot all Y columns
+        # Create a line per Y column; the data for the visible window is
+        # filled in by refresh_lines() once the initial view is known
         lines = []
-        for col in y_columns:
-            line, = ax.plot(x_data, df[col], label=col, marker='o', markersize=4)
+        for col in y_col_names:
+            line, = ax.plot([], [], label=col, marker='o', markersize=4)
             lines.append(line)
         
         # Set labels and title
@@ -61,40 +384,100 @@ def plot_csv_data(csv_file, x_tick_spacing=10, y_tick_spacing=None):
         # Set Y limits with some padding
         ax.set_ylim(y_min - 0.05 * y_range, y_max + 0.05 * y_range)
         
-        # Setup X-axis ticks based on data point spacing
-        # Generate tick positions for ALL data points at the specified interval
-        tick_indices = list(range(0, n_points, x_tick_spacing))
-        if tick_indices[-1] != n_points - 1:
-            tick_indices.append(n_points - 1)  # Always include last point
-        
-        all_tick_positions = [x_data.iloc[i] for i in tick_indices]
-        all_tick_labels = [f'{x_data.iloc[i]:.4g}' for i in tick_indices]
-        
-        ax.set_xticks(all_tick_positions)
-        ax.set_xticklabels(all_tick_labels, rotation=45, ha='right')
-        
-        # Setup Y-axis ticks
-        if y_tick_spacing:
-            # Calculate how many ticks we want based on spacing
-            n_y_ticks = max(2, int(n_points / y_tick_spacing) + 1)
-            y_tick_step = y_range / (n_y_ticks - 1)
-            y_tick_positions = [y_min + i * y_tick_step for i in range(n_y_ticks)]
-            ax.set_yticks(y_tick_positions)
-            ax.set_yticklabels([f'{pos:.4g}' for pos in y_tick_positions])
+        setup_ticks(ax, x_arr, y_min, y_range, x_tick_spacing, y_tick_spacing)
         
         # Calculate initial window size (show about 50 data points initially, or all if less)
         initial_window = min(50, n_points)
         window_size = initial_window
         
         # Initial X limits
-        initial_xlim = (x_data.iloc[0], x_data.iloc[min(window_size - 1, n_points - 1)])
+        initial_xlim = (x_arr[0], x_arr[min(window_size - 1, n_points - 1)])
         ax.set_xlim(initial_xlim)
         
+        # Data indices currently drawn by each line (lines may be decimated)
+        line_indices = [None] * len(lines)
+        
+        # Display-space positions of all drawn points for hover lookups.
+        # Built on the first hover after the view or line data changes.
+        hover_cache = None
+        # Pick radius in points; converted with the current DPI on each query
+        # because HiDPI backends change fig.dpi after the window is shown
+        pick_radius = lines[0].get_pickradius()
+        line_numbers = np.arange(len(lines))
+        
+        def invalidate_hover_cache(*args):
+            """Drop the hover lookup structure after a view change"""
+            nonlocal hover_cache
+            hover_cache = None
+        
+        def build_hover_cache():
+            """Transform every drawn point to display space in one call"""
+            point_lines = np.repeat(line_numbers, [len(indices) for indices in line_indices])
+            point_indices = np.concatenate(line_indices)
+            points = ax.transData.transform(
+                np.column_stack([x_arr[point_indices], y_mat[point_indices, point_lines]])
+            )
+            
+            finite = np.isfinite(points).all(axis=1)
+            points = points[finite]
+            tree = cKDTree(points) if cKDTree is not None and len(points) else None
+            return points, tree, point_lines[finite], point_indices[finite]
+        
+        def find_hover_point(x, y):
+            """Return (line number, data index) of the drawn point nearest to display position (x, y)"""
+            nonlocal hover_cache
+            if hover_cache is None:
+                hover_cache = build_hover_cache()
+            points, tree, point_lines, point_indices = hover_cache
+            
+            if len(points) == 0:
+                return None
+            
+            hover_radius = pick_radius * fig.dpi / 72
+            if tree is not None:
+                dist, k = tree.query((x, y), distance_upper_bound=hover_radius)
+                if np.isinf(dist):
+                    return None
+            else:
+                dist_sq = (points[:, 0] - x) ** 2 + (points[:, 1] - y) ** 2
+                k = dist_sq.argmin()
+                if dist_sq[k] > hover_radius ** 2:
+                    return None
+            
+            return point_lines[k], point_indices[k]
+        
+        ax.callbacks.connect('xlim_changed', invalidate_hover_cache)
+        ax.callbacks.connect('ylim_changed', invalidate_hover_cache)
+        fig.canvas.mpl_connect('resize_event', invalidate_hover_cache)
+        
+        # Index range currently held by the lines
+        drawn_window = None
+        
+        def refresh_lines(start_idx, end_idx):
+            """Replace each line's data with the (decimated) visible window"""
+            nonlocal drawn_window
+            if drawn_window == (start_idx, end_idx):
+                return
+            drawn_window = (start_idx, end_idx)
+            
+            invalidate_hover_cache()
+            show_markers = end_idx - start_idx + 1 <= MARKER_POINT_LIMIT
+            for j, line in enumerate(lines):
+                y_window = y_mat[start_idx:end_idx + 1, j]
+                indices = start_idx + decimate_minmax(y_window)
+                line_indices[j] = indices
+                line.set_data(x_arr[indices], y_mat[indices, j])
+                line.set_marker('o' if show_markers else 'None')
+        
+        refresh_lines(0, window_size - 1)
+        
         # State variables
         current_pos = 0
         is_dragging = False
-        selection_rect = None
+        background = None
+        drag_ylim = None
         start_x = None
+        hover_cid = None
         
         # Create horizontal scroll slider
         ax_scroll = plt.axes([0.15, 0.05, 0.7, 0.03])
@@ -111,24 +494,45 @@ def plot_csv_data(csv_file, x_tick_spacing=10, y_tick_spacing=None):
         def update_view(pos):
             """Update the visible window based on scroll position"""
             nonlocal current_pos
-            current_pos = int(pos)
+            new_pos = int(pos)
+            if new_pos == current_pos:
+                return
+            current_pos = new_pos
             
             # Calculate which points to show
             start_idx = current_pos
             end_idx = min(current_pos + window_size - 1, n_points - 1)
             
             # Set X limits to show this window
-            x_left = x_data.iloc[start_idx]
-            x_right = x_data.iloc[end_idx]
+            x_left = x_arr[start_idx]
+            x_right = x_arr[end_idx]
             ax.set_xlim(x_left, x_right)
+            refresh_lines(start_idx, end_idx)
             
             fig.canvas.draw_idle()
         
+        def nearest_index(x_val):
+            """Return the index of the data point whose X value is closest to x_val"""
+            if not x_sorted:
+                return int(np.nanargmin(np.abs(x_arr - x_val)))
+            
+            idx = min(int(np.searchsorted(x_arr, x_val)), n_points - 1)
+            if idx > 0 and abs(x_arr[idx - 1] - x_val) <= abs(x_arr[idx] - x_val):
+                idx -= 1
+            return idx
+        
         def on_scroll(val):
             """Handle scroll slider movement"""
             update_view(val)
         
-        scroll_slider.on_changed(on_scroll)
+        scroll_cid = scroll_slider.on_changed(on_scroll)
+        
+        def set_slider_quietly(val):
+            """Move the slider without triggering update_view()"""
+            nonlocal scroll_cid
+            scroll_slider.disconnect(scroll_cid)
+            scroll_slider.set_val(val)
+            scroll_cid = scroll_slider.on_changed(on_scroll)
         
         # Add annotation for hover display
         annot = ax.annotate("", xy=(0,0), xytext=(10,10), textcoords="offset points",
@@ -136,9 +540,25 @@ def plot_csv_data(csv_file, x_tick_spacing=10, y_tick_spacing=None):
                            arrowprops=dict(arrowstyle="->"))
         annot.set_visible(False)
         
+        # Zoom selection rectangle, shown and resized while dragging. It is
+        # animated so that it is only ever drawn by blitting.
+        selection_rect = Rectangle(
+            (0, 0),
+            0,
+            0,
+            fill=True,
+            facecolor='blue',
+            alpha=0.2,
+            edgecolor='blue',
+            linewidth=2,
+            animated=True
+        )
+        ax.add_patch(selection_rect)
+        selection_rect.set_visible(False)
+        
         def on_press(event):
             """Handle mouse button press"""
-            nonlocal start_x, is_dragging, selection_rect, window_size, current_pos
+            nonlocal start_x, is_dragging, drag_ylim, hover_cid, window_size, current_pos
             
             if event.inaxes != ax:
                 return
@@ -148,9 +568,10 @@ def plot_csv_data(csv_file, x_tick_spacing=10, y_tick_spacing=None):
                 window_size = n_points
                 current_pos = 0
                 scroll_slider.valmax = max(0, n_points - window_size)
-                scroll_slider.set_val(0)
+                set_slider_quietly(0)
                 ax.set_xlim(x_min, x_max)
-                fig.canvas.draw()
+                refresh_lines(0, n_points - 1)
+                fig.canvas.draw_idle()
                 return
             
             # Left click starts selection (for zoom)
@@ -158,42 +579,49 @@ def plot_csv_data(csv_file, x_tick_spacing=10, y_tick_spacing=None):
                 start_x = event.xdata
                 is_dragging = True
                 
-                if selection_rect is not None:
-                    selection_rect.remove()
-                    selection_rect = None
+                # Hover lookups are skipped entirely while dragging
+                if hover_cid is not None:
+                    fig.canvas.mpl_disconnect(hover_cid)
+                    hover_cid = None
+                
+                # The Y range can't change during a drag, so look it up once
+                drag_ylim = ax.get_ylim()
+                selection_rect.set_bounds(start_x, drag_ylim[0], 0, drag_ylim[1] - drag_ylim[0])
+                selection_rect.set_visible(True)
+                
+                # The background cached by on_draw can be reused as is unless
+                # the hover annotation has to be cleared from it first
+                if annot.get_visible() or background is None:
+                    annot.set_visible(False)
+                    fig.canvas.draw()
         
         def on_motion(event):
             """Handle mouse motion"""
-            nonlocal selection_rect
-            
             if is_dragging and event.inaxes == ax and start_x is not None:
-                if selection_rect is not None:
-                    selection_rect.remove()
-                
                 current_x = event.xdata
-                ylim = ax.get_ylim()
                 
                 rect_x = min(start_x, current_x)
                 rect_width = abs(current_x - start_x)
-                rect_y = ylim[0]
-                rect_height = ylim[1] - ylim[0]
+                rect_y = drag_ylim[0]
+                rect_height = drag_ylim[1] - drag_ylim[0]
                 
-                selection_rect = Rectangle(
-                    (rect_x, rect_y), 
-                    rect_width, 
-                    rect_height,
-                    fill=True,
-                    facecolor='blue',
-                    alpha=0.2,
-                    edgecolor='blue',
-                    linewidth=2
-                )
-                ax.add_patch(selection_rect)
-                fig.canvas.draw_idle()
+                # Blit only the selection rectangle over the cached background
+                # instead of redrawing every line on each mouse move
+                selection_rect.set_bounds(rect_x, rect_y, rect_width, rect_height)
+                fig.canvas.restore_region(background)
+                ax.draw_artist(selection_rect)
+                fig.canvas.blit(ax.bbox)
         
         def on_release(event):
             """Handle mouse button release"""
-            nonlocal is_dragging, selection_rect, start_x, window_size, current_pos
+            nonlocal is_dragging, start_x, hover_cid, window_size, current_pos
+            
+            if hover_cid is None:
+                hover_cid = fig.canvas.mpl_connect('motion_notify_event', on_hover)
+            
+            if selection_rect.get_visible():
+                selection_rect.set_visible(False)
+                fig.canvas.draw_idle()
             
             if not is_dragging or event.inaxes != ax or start_x is None:
                 is_dragging = False
@@ -205,16 +633,12 @@ def plot_csv_data(csv_file, x_tick_spacing=10, y_tick_spacing=None):
             if end_x is None:
                 return
             
-            if selection_rect is not None:
-                selection_rect.remove()
-                selection_rect = None
-            
             x_left = min(start_x, end_x)
             x_right = max(start_x, end_x)
             
             # Find corresponding data point indices
-            left_idx = (x_data - x_left).abs().argmin()
-            right_idx = (x_data - x_right).abs().argmin()
+            left_idx = nearest_index(x_left)
+            right_idx = nearest_index(x_right)
             
             # Only zoom if selection is meaningful (at least 2 points)
             if right_idx - left_idx >= 1:
@@ -223,42 +647,59 @@ def plot_csv_data(csv_file, x_tick_spacing=10, y_tick_spacing=None):
                 
                 # Update slider
                 scroll_slider.valmax = max(0, n_points - window_size)
-                scroll_slider.set_val(min(current_pos, scroll_slider.valmax))
+                set_slider_quietly(min(current_pos, scroll_slider.valmax))
                 
-                ax.set_xlim(x_data.iloc[left_idx], x_data.iloc[right_idx])
-                fig.canvas.draw()
+                ax.set_xlim(x_arr[left_idx], x_arr[right_idx])
+                refresh_lines(left_idx, right_idx)
+                fig.canvas.draw_idle()
             
             start_x = None
         
         def on_hover(event):
             """Handle mouse hover to show data point values"""
-            if event.inaxes != ax or is_dragging:
-                annot.set_visible(False)
-                fig.canvas.draw_idle()
+            if event.inaxes != ax:
+                if annot.get_visible():
+                    annot.set_visible(False)
+                    fig.canvas.draw_idle()
                 return
             
-            for line, col_name in zip(lines, y_columns):
-                contains, ind = line.contains(event)
-                if contains:
-                    index = ind["ind"][0]
-                    x_val = x_data.iloc[index]
-                    y_val = df[col_name].iloc[index]
-                    
-                    annot.xy = (x_val, y_val)
-                    text = f"{col_name}\n{x_label}: {x_val:.4g}\nY: {y_val:.4g}"
-                    annot.set_text(text)
-                    annot.set_visible(True)
-                    fig.canvas.draw_idle()
+            hit = find_hover_point(event.x, event.y)
+            if hit is not None:
+                j, index = hit
+                col_name = y_col_names[j]
+                x_val = x_arr[index]
+                y_val = y_mat[index, j]
+                
+                text = f"{col_name}\n{x_label}: {x_val:.4g}\nY: {y_val:.4g}"
+                
+                # Still over the same point: nothing to redraw
+                if (annot.get_visible() and annot.xy == (x_val, y_val)
+                        and annot.get_text() == text):
                     return
+                
+                annot.xy = (x_val, y_val)
+                annot.set_text(text)
+                annot.set_visible(True)
+                fig.canvas.draw_idle()
+                return
             
-            annot.set_visible(False)
-            fig.canvas.draw_idle()
+            if annot.get_visible():
+                annot.set_visible(False)
+                fig.canvas.draw_idle()
+        
+        def on_draw(event):
+            """Cache the axes background after every full redraw for blitting"""
+            nonlocal background
+            # Animated artists (the selection rectangle) are left out of a
+            # full draw, so the cached background never includes them
+            background = fig.canvas.copy_from_bbox(ax.bbox)
         
         # Connect event handlers
+        fig.canvas.mpl_connect('draw_event', on_draw)
         fig.canvas.mpl_connect('button_press_event', on_press)
         fig.canvas.mpl_connect('motion_notify_event', on_motion)
         fig.canvas.mpl_connect('button_release_event', on_release)
-        fig.canvas.mpl_connect('motion_notify_event', on_hover)
+        hover_cid = fig.canvas.mpl_connect('motion_notify_event', on_hover)
         
         plt.show()
         
@@ -293,9 +734,20 @@ def main():
         default=None,
         help='Number of data points between Y-axis tick marks (optional)'
     )
+    parser.add_argument(
+        '--fast-io',
+        action='store_true',
+        help='Read the CSV file with the pyarrow engine (requires pyarrow)'
+    )
+    parser.add_argument(
+        '--float32',
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help='Store data as float32 to halve memory use (default: only for files over 100 MB)'
+    )
     
     args = parser.parse_args()
-    plot_csv_data(args.csv_file, args.x_spacing, args.y_spacing)
+    plot_csv_data(args.csv_file, args.x_spacing, args.y_spacing, args.fast_io, args.float32)
 
 if __name__ == "__main__":
     main()